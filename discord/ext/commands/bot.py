@@ -1167,7 +1167,9 @@ class BotBase(GroupMixin):
         ctx.invoked_with = invoker
         # type-checker fails to narrow invoked_prefix type.
         ctx.prefix = invoked_prefix  # type: ignore
+        ctx._prefix_len = len(invoked_prefix) if invoked_prefix else 0
         ctx.command = self.all_commands.get(invoker)
+        ctx.valid = invoked_prefix is not None and ctx.command is not None
         return ctx
 
     async def invoke(self, ctx: Context) -> None:
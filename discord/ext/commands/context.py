@@ -23,9 +23,10 @@ DEALINGS IN THE SOFTWARE.
 """
 from __future__ import annotations
 
+import functools
 import inspect
 import re
-from datetime import timedelta
+import time
 from typing import Any, Dict, Generic, List, Literal, Optional, TYPE_CHECKING, TypeVar, Union, overload
 
 import discord.abc
@@ -34,6 +35,8 @@ import discord.utils
 from discord.message import Message
 from discord import Permissions
 
+from .errors import CommandError
+
 if TYPE_CHECKING:
     from typing_extensions import ParamSpec
 
@@ -56,6 +59,12 @@ __all__ = ("Context",)
 
 MISSING: Any = discord.utils.MISSING
 
+# interaction tokens are valid for 15 minutes after the initial response
+_INTERACTION_EXPIRY_SECONDS = 15 * 60.0
+
+# Messageable.send arguments that interaction responses don't understand
+_UNSUPPORTED_INTERACTION_KWARGS = frozenset(("nonce", "stickers", "reference", "mention_author"))
+
 
 T = TypeVar("T")
 BotT = TypeVar("BotT", bound="Union[Bot, AutoShardedBot]")
@@ -67,6 +76,56 @@ else:
     P = TypeVar("P")
 
 
+# .core imports this module, so its names can only be resolved lazily; doing
+# so once and publishing them as module globals keeps the import machinery
+# (sys.modules lookup plus the import lock) out of every send_help call.
+_Group: Any = None
+_Command: Any = None
+_wrap_callback: Any = None
+
+
+def _resolve_core_imports() -> None:
+    global _Group, _Command, _wrap_callback
+    from .core import Group as _Group, Command as _Command, wrap_callback as _wrap_callback
+
+
+# maps concrete entity types to the HelpCommand method that renders them, so
+# repeated help lookups dispatch with one dict hit instead of walking the
+# hasattr/isinstance chain every time.
+_HELP_METHOD_CACHE: Dict[type, Optional[str]] = {}
+
+
+def _help_method_name(entity: Any) -> Optional[str]:
+    cls = type(entity)
+    try:
+        return _HELP_METHOD_CACHE[cls]
+    except KeyError:
+        # __cog_commands__ is set by CogMeta, and Group/Command membership is
+        # a property of the class, so caching per-type is safe.
+        if hasattr(entity, "__cog_commands__"):
+            name = "send_cog_help"
+        elif isinstance(entity, _Group):
+            name = "send_group_help"
+        elif isinstance(entity, _Command):
+            name = "send_command_help"
+        else:
+            name = None
+        _HELP_METHOD_CACHE[cls] = name
+        return name
+
+
+# shared default for contexts created without ignored parameters; it is only
+# ever membership-tested or replaced wholesale, never mutated in place.
+_EMPTY_IGNORED_PARAMS: List[inspect.Parameter] = []
+
+
+@functools.lru_cache(maxsize=4)
+def _mention_pattern(user_id: int) -> re.Pattern:
+    # compiling the mention regex is surprisingly expensive to do on every
+    # clean_prefix access, and the bot's user ID never changes mid-process.
+    return re.compile(r"<@!?%d>" % user_id)
+
+
 class Context(discord.abc.Messageable, Generic[BotT]):
     r"""Represents the context in which a command is being invoked under.
 
@@ -121,8 +180,36 @@ class Context(discord.abc.Messageable, Generic[BotT]):
     command_failed: :class:`bool`
         A boolean that indicates if the command failed to be parsed, checked,
         or invoked.
+    valid: :class:`bool`
+        Whether the invocation context is valid to be invoked with.
     """
-    interaction: Optional[Interaction] = None
+    __slots__ = (
+        "message",
+        "bot",
+        "args",
+        "kwargs",
+        "prefix",
+        "_prefix_len",
+        "command",
+        "view",
+        "invoked_with",
+        "invoked_parents",
+        "invoked_subcommand",
+        "subcommand_passed",
+        "command_failed",
+        "current_parameter",
+        "valid",
+        "interaction",
+        "_ignored_params",
+        "_state",
+        "_guild",
+        "_channel",
+        "_author",
+        "_me",
+        "_perms_cache",
+    )
+
+    interaction: Optional[Interaction]
 
     def __init__(
         self,
@@ -143,9 +230,15 @@ class Context(discord.abc.Messageable, Generic[BotT]):
     ):
         self.message: Message = message
         self.bot: BotT = bot
-        self.args: List[Any] = args or []
-        self.kwargs: Dict[str, Any] = kwargs or {}
+        # args/kwargs are left unset when MISSING and materialised lazily by
+        # __getattr__, so contexts that never reach argument parsing (e.g.
+        # non-command messages) don't allocate containers they never use.
+        if args is not MISSING:
+            self.args: List[Any] = args
+        if kwargs is not MISSING:
+            self.kwargs: Dict[str, Any] = kwargs
         self.prefix: Optional[str] = prefix
+        self._prefix_len: int = len(prefix) if prefix else 0
         self.command: Optional[Command] = command
         self.view: StringView = view
         self.invoked_with: Optional[str] = invoked_with
@@ -154,8 +247,30 @@ class Context(discord.abc.Messageable, Generic[BotT]):
         self.subcommand_passed: Optional[str] = subcommand_passed
         self.command_failed: bool = command_failed
         self.current_parameter: Optional[inspect.Parameter] = current_parameter
-        self._ignored_params: List[inspect.Parameter] = []
-        self._state: ConnectionState = self.message._state
+        self.valid: bool = prefix is not None and command is not None
+        self.interaction: Optional[Interaction] = None
+        self._ignored_params: List[inspect.Parameter] = _EMPTY_IGNORED_PARAMS
+        self._state: ConnectionState = message._state
+        # these are read on nearly every invocation, so assigning them up
+        # front is cheaper than paying descriptor dispatch on first access.
+        self._guild: Optional[Guild] = message.guild
+        self._channel: MessageableChannel = message.channel
+        self._author: Union[User, Member] = message.author
+        # bot.user will never be None by the time a context is constructed.
+        self._me: Union[Member, ClientUser] = self._guild.me if self._guild is not None else bot.user  # type: ignore
+        self._perms_cache: Optional[Permissions] = None
+
+    def __getattr__(self, name: str) -> Any:
+        # only reached when a slot was never assigned; each instance gets its
+        # own container here so nothing mutable is ever shared between
+        # contexts.
+        if name == "args":
+            self.args = args = []
+            return args
+        if name == "kwargs":
+            self.kwargs = kwargs = {}
+            return kwargs
+        raise AttributeError(f"{self.__class__.__name__!r} object has no attribute {name!r}")
 
     async def invoke(self, command: Command[CogT, P, T], /, *args: P.args, **kwargs: P.kwargs) -> T:
         r"""|coro|
@@ -226,15 +341,18 @@ class Context(discord.abc.Messageable, Generic[BotT]):
             raise ValueError("This context is not valid.")
 
         # some state to revert to when we're done
-        index, previous = view.index, view.previous
-        invoked_with = self.invoked_with
-        invoked_subcommand = self.invoked_subcommand
-        invoked_parents = self.invoked_parents
-        subcommand_passed = self.subcommand_passed
+        saved = (
+            view.index,
+            view.previous,
+            self.invoked_with,
+            self.invoked_subcommand,
+            self.invoked_parents,
+            self.subcommand_passed,
+        )
 
         if restart:
             to_call = cmd.root_parent or cmd
-            view.index = len(self.prefix or "")
+            view.index = self._prefix_len
             view.previous = 0
             self.invoked_parents = []
             self.invoked_with = view.get_word()  # advance to get the root command
@@ -245,20 +363,19 @@ class Context(discord.abc.Messageable, Generic[BotT]):
             await to_call.reinvoke(self, call_hooks=call_hooks)
         finally:
             self.command = cmd
-            view.index = index
-            view.previous = previous
-            self.invoked_with = invoked_with
-            self.invoked_subcommand = invoked_subcommand
-            self.invoked_parents = invoked_parents
-            self.subcommand_passed = subcommand_passed
-
-    @property
-    def valid(self) -> bool:
-        """:class:`bool`: Checks if the invocation context is valid to be invoked with."""
-        return self.prefix is not None and self.command is not None
+            (
+                view.index,
+                view.previous,
+                self.invoked_with,
+                self.invoked_subcommand,
+                self.invoked_parents,
+                self.subcommand_passed,
+            ) = saved
 
     async def _get_channel(self) -> discord.abc.Messageable:
-        return self.channel
+        # read the slot directly; this must stay a coroutine because
+        # Messageable.send awaits it.
+        return self._channel
 
     @property
     def clean_prefix(self) -> str:
@@ -269,13 +386,21 @@ class Context(discord.abc.Messageable, Generic[BotT]):
         if self.prefix is None:
             return ""
 
+        # the overwhelmingly common case is a plain textual prefix like "!"
+        # that cannot possibly contain a mention, so skip the regex entirely.
+        if "<@" not in self.prefix:
+            return self.prefix
+
         user = self.me
         # this breaks if the prefix mention is not the bot itself but I
         # consider this to be an *incredibly* strange use case. I'd rather go
         # for this common use case rather than waste performance for the
         # odd one.
-        pattern = re.compile(r"<@!?%s>" % user.id)
-        return pattern.sub("@%s" % user.display_name.replace("\\", r"\\"), self.prefix)
+        name = user.display_name
+        # escaping is only needed for the rare display name with a backslash
+        if "\\" in name:
+            name = name.replace("\\", r"\\")
+        return _mention_pattern(user.id).sub(f"@{name}", self.prefix)
 
     @property
     def cog(self) -> Optional[Cog]:
@@ -285,32 +410,31 @@ class Context(discord.abc.Messageable, Generic[BotT]):
             return None
         return self.command.cog
 
-    @discord.utils.cached_property
+    @property
     def guild(self) -> Optional[Guild]:
         """Optional[:class:`.Guild`]: Returns the guild associated with this context's command. None if not available."""
-        return self.message.guild
+        return self._guild
 
-    @discord.utils.cached_property
+    @property
     def channel(self) -> MessageableChannel:
         """Union[:class:`.abc.Messageable`]: Returns the channel associated with this context's command.
         Shorthand for :attr:`.Message.channel`.
         """
-        return self.message.channel
+        return self._channel
 
-    @discord.utils.cached_property
+    @property
     def author(self) -> Union[User, Member]:
         """Union[:class:`~discord.User`, :class:`.Member`]:
         Returns the author associated with this context's command. Shorthand for :attr:`.Message.author`
         """
-        return self.message.author
+        return self._author
 
-    @discord.utils.cached_property
+    @property
     def me(self) -> Union[Member, ClientUser]:
         """Union[:class:`.Member`, :class:`.ClientUser`]:
         Similar to :attr:`.Guild.me` except it may return the :class:`.ClientUser` in private message contexts.
         """
-        # bot.user will never be None at this point.
-        return self.guild.me if self.guild is not None else self.bot.user  # type: ignore
+        return self._me
 
     @property
     def voice_client(self) -> Optional[VoiceProtocol]:
@@ -321,9 +445,16 @@ class Context(discord.abc.Messageable, Generic[BotT]):
     def author_permissions(self) -> Permissions:
         """Returns the author permissions in the given channel.
 
+        The result is computed once per context; stacked permission checks
+        share the cached value since channel and author cannot change
+        mid-invocation.
+
         .. versionadded:: 2.0
         """
-        return self.channel.permissions_for(self.author)
+        perms = self._perms_cache
+        if perms is None:
+            self._perms_cache = perms = self._channel.permissions_for(self._author)
+        return perms
 
     async def send_help(self, *args: Any) -> Any:
         """send_help(entity=<bot>)
@@ -355,8 +486,8 @@ class Context(discord.abc.Messageable, Generic[BotT]):
         Any
             The result of the help command, if any.
         """
-        from .core import Group, Command, wrap_callback
-        from .errors import CommandError
+        if _wrap_callback is None:
+            _resolve_core_imports()
 
         bot = self.bot
         cmd = bot.help_command
@@ -364,12 +495,13 @@ class Context(discord.abc.Messageable, Generic[BotT]):
         if cmd is None:
             return None
 
-        cmd = cmd.copy()
+        if cmd._needs_copy:
+            cmd = cmd.copy()
         cmd.context = self
         if len(args) == 0:
             await cmd.prepare_help_command(self, None)
             mapping = cmd.get_bot_mapping()
-            injected = wrap_callback(cmd.send_bot_help)
+            injected = _wrap_callback(cmd.send_bot_help)
             try:
                 return await injected(mapping)
             except CommandError as e:
@@ -391,18 +523,13 @@ class Context(discord.abc.Messageable, Generic[BotT]):
 
         await cmd.prepare_help_command(self, entity.qualified_name)
 
+        method = _help_method_name(entity)
+        if method is None:
+            return None
+
         try:
-            if hasattr(entity, "__cog_commands__"):
-                injected = wrap_callback(cmd.send_cog_help)
-                return await injected(entity)
-            elif isinstance(entity, Group):
-                injected = wrap_callback(cmd.send_group_help)
-                return await injected(entity)
-            elif isinstance(entity, Command):
-                injected = wrap_callback(cmd.send_command_help)
-                return await injected(entity)
-            else:
-                return None
+            injected = _wrap_callback(getattr(cmd, method))
+            return await injected(entity)
         except CommandError as e:
             await cmd.on_help_command_error(self, e)
 
@@ -455,30 +582,35 @@ class Context(discord.abc.Messageable, Generic[BotT]):
             In a normal context, it always returns a :class:`.Message`
         """
 
-        if self.interaction is None or (
-            self.interaction.response.responded_at is not None
-            and discord.utils.utcnow() - self.interaction.response.responded_at >= timedelta(minutes=15)
-        ):
+        # the classic prefix-command case has no interaction at all, so get it
+        # out of the way first without evaluating any of the expiry logic.
+        interaction = self.interaction
+        if interaction is None:
+            return await super().send(content, **kwargs)
+
+        response = interaction.response
+        responded_at = response._responded_at_monotonic
+        if responded_at is not None and time.monotonic() - responded_at >= _INTERACTION_EXPIRY_SECONDS:
             return await super().send(content, **kwargs)
 
-        # Remove unsupported arguments from kwargs
-        kwargs.pop("nonce", None)
-        kwargs.pop("stickers", None)
-        kwargs.pop("reference", None)
-        kwargs.pop("mention_author", None)
+        # Remove unsupported arguments in a single pass; rebuilding the dict
+        # also means the caller's kwargs are never mutated.
+        kwargs = {k: v for k, v in kwargs.items() if k not in _UNSUPPORTED_INTERACTION_KWARGS}
 
         if not (
             return_message
-            or self.interaction.response.is_done()
-            or any(arg in kwargs for arg in ("file", "files", "allowed_mentions"))
+            or response.is_done()
+            or "file" in kwargs
+            or "files" in kwargs
+            or "allowed_mentions" in kwargs
         ):
-            send = self.interaction.response.send_message
+            send = response.send_message
         else:
             # We have to defer in order to use the followup webhook
-            if not self.interaction.response.is_done():
-                await self.interaction.response.defer(ephemeral=ephemeral)
+            if not response.is_done():
+                await response.defer(ephemeral=ephemeral)
 
-            send = self.interaction.followup.send
+            send = interaction.followup.send
 
         return await send(content, ephemeral=ephemeral, **kwargs)  # type: ignore
 
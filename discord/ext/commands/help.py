@@ -304,6 +304,11 @@ class HelpCommand:
 
     MENTION_PATTERN = re.compile("|".join(MENTION_TRANSFORMS.keys()))
 
+    # Whether invoking help needs to operate on a fresh copy of this instance
+    # (see :issue:`2123`). Subclasses that keep no per-invocation state beyond
+    # :attr:`context` may set this to ``False`` to skip the copy.
+    _needs_copy: bool = True
+
     def __new__(cls, *args, **kwargs):
         # To prevent race conditions of a single instance while also allowing
         # for settings to be passed the original arguments passed must be assigned
@@ -27,6 +27,7 @@ DEALINGS IN THE SOFTWARE.
 from __future__ import annotations
 from typing import Any, Dict, List, Optional, TYPE_CHECKING, Tuple, Union
 import asyncio
+import time
 
 from . import utils
 from .enums import try_enum, InteractionType, InteractionResponseType
@@ -380,13 +381,21 @@ class InteractionResponse:
 
     __slots__: Tuple[str, ...] = (
         "responded_at",
+        "_responded_at_monotonic",
         "_parent",
     )
 
     def __init__(self, parent: Interaction):
         self.responded_at: Optional[datetime] = None
+        self._responded_at_monotonic: Optional[float] = None
         self._parent: Interaction = parent
 
+    def _mark_responded(self) -> None:
+        # the monotonic companion lets hot paths compare elapsed time with a
+        # float subtraction instead of datetime arithmetic
+        self.responded_at = utils.utcnow()
+        self._responded_at_monotonic = time.monotonic()
+
     def is_done(self) -> bool:
         """:class:`bool`: Indicates whether an interaction response has been done before.
 
@@ -434,7 +443,7 @@ class InteractionResponse:
                 parent.id, parent.token, session=parent._session, type=defer_type, data=data
             )
 
-            self.responded_at = utils.utcnow()
+            self._mark_responded()
 
     async def pong(self) -> None:
         """|coro|
@@ -459,7 +468,7 @@ class InteractionResponse:
             await adapter.create_interaction_response(
                 parent.id, parent.token, session=parent._session, type=InteractionResponseType.pong.value
             )
-            self.responded_at = utils.utcnow()
+            self._mark_responded()
 
     async def send_message(
         self,
@@ -552,7 +561,7 @@ class InteractionResponse:
 
             self._parent._state.store_view(view)
 
-        self.responded_at = utils.utcnow()
+        self._mark_responded()
         if delete_after is not None:
             self._parent.delete_original_message(delay=delete_after)
 
@@ -646,7 +655,7 @@ class InteractionResponse:
         if view and not view.is_finished():
             state.store_view(view, message_id)
 
-        self.responded_at = utils.utcnow()
+        self._mark_responded()
 
 
 class _InteractionMessageState: